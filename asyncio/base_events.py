@@ -18,6 +18,7 @@
 import concurrent.futures
 import heapq
 import inspect
+import itertools
 import logging
 import os
 import socket
@@ -185,6 +186,8 @@ def __init__(self):
         self._closed = False
         self._ready = collections.deque()
         self._scheduled = []
+        # Tie-breaker for timers sharing the same deadline
+        self._timer_seq = itertools.count()
         self._default_executor = None
         self._internal_fds = 0
         # Identifier of the thread running the event loop, or None if the
@@ -434,7 +437,9 @@ def call_at(self, when, callback, *args):
         timer = events.TimerHandle(when, callback, args, self)
         if timer._source_traceback:
             del timer._source_traceback[-1]
-        heapq.heappush(self._scheduled, timer)
+        # Push (when, seq, handle) so that the heap compares floats and
+        # integers directly and never compares the handles themselves.
+        heapq.heappush(self._scheduled, (when, next(self._timer_seq), timer))
         timer._scheduled = True
         return timer
 
@@ -1114,20 +1119,21 @@ def _run_once(self):
             # Remove delayed calls that were cancelled if their number
             # is too high
             new_scheduled = []
-            for handle in self._scheduled:
+            for entry in self._scheduled:
+                handle = entry[2]
                 if handle._cancelled:
                     handle._scheduled = False
                 else:
-                    new_scheduled.append(handle)
+                    new_scheduled.append(entry)
 
             heapq.heapify(new_scheduled)
             self._scheduled = new_scheduled
             self._timer_cancelled_count = 0
         else:
             # Remove delayed calls that were cancelled from head of queue.
-            while self._scheduled and self._scheduled[0]._cancelled:
+            while self._scheduled and self._scheduled[0][2]._cancelled:
                 self._timer_cancelled_count -= 1
-                handle = heapq.heappop(self._scheduled)
+                when, seq, handle = heapq.heappop(self._scheduled)
                 handle._scheduled = False
 
         timeout = None
@@ -1135,7 +1141,7 @@ def _run_once(self):
             timeout = 0
         elif self._scheduled:
             # Compute the desired timeout.
-            when = self._scheduled[0]._when
+            when = self._scheduled[0][0]
             timeout = max(0, when - self.time())
 
         if self._debug and timeout != 0:
@@ -1165,10 +1171,9 @@ def _run_once(self):
         # Handle 'later' callbacks that are ready.
         end_time = self.time() + self._clock_resolution
         while self._scheduled:
-            handle = self._scheduled[0]
-            if handle._when >= end_time:
+            if self._scheduled[0][0] >= end_time:
                 break
-            handle = heapq.heappop(self._scheduled)
+            when, seq, handle = heapq.heappop(self._scheduled)
             handle._scheduled = False
             self._ready.append(handle)
 
@@ -3,6 +3,7 @@
 import warnings
 
 from . import compat
+from . import events
 from . import futures
 from . import protocols
 from . import transports
@@ -176,10 +177,7 @@ def _connect_pipes(self, waiter):
 
             assert self._pending_calls is not None
 
-            loop.call_soon(self._protocol.connection_made, self)
-            for callback, data in self._pending_calls:
-                loop.call_soon(callback, *data)
-            self._pending_calls = None
+            loop.call_soon(self._call_connection_made)
         except Exception as exc:
             if waiter is not None and not waiter.cancelled():
                 waiter.set_exception(exc)
@@ -187,6 +185,23 @@ def _connect_pipes(self, waiter):
             if waiter is not None and not waiter.cancelled():
                 waiter.set_result(None)
 
+    def _call_connection_made(self):
+        # Keep queueing events until connection_made() and the events
+        # received so far have been delivered, so that a pipe callback
+        # running in the meantime cannot overtake them.
+        loop = self._loop
+        pending_calls = self._pending_calls
+        pending_calls.appendleft((self._protocol.connection_made, (self,)))
+        try:
+            while pending_calls:
+                callback, data = pending_calls.popleft()
+                # Run each call in its own handle, as call_soon() would:
+                # an exception is reported to the exception handler and
+                # does not drop the events queued after it.
+                events.Handle(callback, data, loop)._run()
+        finally:
+            self._pending_calls = None
+
     def _call(self, cb, *data):
         if self._pending_calls is not None:
             self._pending_calls.append((cb, data))
@@ -198,7 +213,13 @@ def _pipe_connection_lost(self, fd, exc):
         self._try_finish()
 
     def _pipe_data_received(self, fd, data):
-        self._call(self._protocol.pipe_data_received, fd, data)
+        if self._pending_calls is not None:
+            self._pending_calls.append((self._protocol.pipe_data_received,
+                                        (fd, data)))
+        else:
+            # Called by the pipe transport from the event loop: deliver the
+            # data immediately instead of scheduling a callback per chunk.
+            self._protocol.pipe_data_received(fd, data)
 
     def _process_exited(self, returncode):
         assert returncode is not None, returncode
@@ -198,7 +198,7 @@ def coroutine(func):
         @functools.wraps(func)
         def coro(*args, **kw):
             res = func(*args, **kw)
-            if isinstance(res, futures.Future) or inspect.isgenerator(res):
+            if isinstance(res, (futures.Future, types.GeneratorType)):
                 res = yield from res
             elif _AwaitableABC is not None:
                 # If 'func' returns an Awaitable (new in 3.5) we
@@ -246,9 +246,24 @@ def iscoroutinefunction(func):
     _COROUTINE_TYPES += (_CoroutineABC,)
 
 
+# Types already known to be coroutine types.  isinstance() against the
+# Coroutine ABC is slow, and ensure_future() checks every argument.
+_iscoroutine_typecache = set()
+
+
 def iscoroutine(obj):
     """Return True if obj is a coroutine object."""
-    return isinstance(obj, _COROUTINE_TYPES)
+    if type(obj) in _iscoroutine_typecache:
+        return True
+
+    if isinstance(obj, _COROUTINE_TYPES):
+        # Don't cache more than 100 types; that would only happen if
+        # someone creates coroutine types on the fly.
+        if len(_iscoroutine_typecache) < 100:
+            _iscoroutine_typecache.add(type(obj))
+        return True
+    else:
+        return False
 
 
 def _format_coroutine(coro):
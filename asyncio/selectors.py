@@ -33,7 +33,9 @@ def _fileobj_to_fd(fileobj):
         fd = fileobj
     else:
         try:
-            fd = int(fileobj.fileno())
+            fd = fileobj.fileno()
+            if not isinstance(fd, int):
+                fd = int(fd)
         except (AttributeError, TypeError, ValueError):
             raise ValueError("Invalid file object: "
                              "{!r}".format(fileobj)) from None
@@ -242,20 +244,30 @@ def unregister(self, fileobj):
         return key
 
     def modify(self, fileobj, events, data=None):
-        # TODO: Subclasses can probably optimize this even further.
         try:
             key = self._fd_to_key[self._fileobj_lookup(fileobj)]
         except KeyError:
             raise KeyError("{!r} is not registered".format(fileobj)) from None
         if events != key.events:
-            self.unregister(fileobj)
-            key = self.register(fileobj, events, data)
+            if (not events) or (events & ~(EVENT_READ | EVENT_WRITE)):
+                raise ValueError("Invalid events: {!r}".format(events))
+            key = self._modify_events(fileobj, key, events, data)
         elif data != key.data:
             # Use a shortcut to update the data.
             key = key._replace(data=data)
             self._fd_to_key[key.fd] = key
         return key
 
+    def _modify_events(self, fileobj, key, events, data):
+        """Change the events monitored for a registered file object.
+
+        The default implementation unregisters and registers the file
+        object again. Subclasses can override it to update the
+        registration of the file descriptor in place.
+        """
+        self.unregister(fileobj)
+        return self.register(fileobj, events, data)
+
     def close(self):
         self._fd_to_key.clear()
         self._map = None
@@ -263,20 +275,6 @@ def close(self):
     def get_map(self):
         return self._map
 
-    def _key_from_fd(self, fd):
-        """Return the key associated to a given file descriptor.
-
-        Parameters:
-        fd -- file descriptor
-
-        Returns:
-        corresponding key, or None if not found
-        """
-        try:
-            return self._fd_to_key[fd]
-        except KeyError:
-            return None
-
 
 class SelectSelector(_BaseSelectorImpl):
     """Select-based selector."""
@@ -314,16 +312,14 @@ def select(self, timeout=None):
             r, w, _ = self._select(self._readers, self._writers, [], timeout)
         except InterruptedError:
             return ready
-        r = set(r)
-        w = set(w)
-        for fd in r | w:
-            events = 0
-            if fd in r:
-                events |= EVENT_READ
-            if fd in w:
-                events |= EVENT_WRITE
-
-            key = self._key_from_fd(fd)
+        fd_to_events = {}
+        for fd in r:
+            fd_to_events[fd] = EVENT_READ
+        for fd in w:
+            fd_to_events[fd] = fd_to_events.get(fd, 0) | EVENT_WRITE
+        fd_to_key = self._fd_to_key
+        for fd, events in fd_to_events.items():
+            key = fd_to_key.get(fd)
             if key:
                 ready.append((key, events & key.events))
         return ready
@@ -331,6 +327,10 @@ def select(self, timeout=None):
 
 if hasattr(select, 'poll'):
 
+    # poll() event masks indexed by a mask of EVENT_READ|EVENT_WRITE
+    _POLL_EVENTS = (0, select.POLLIN, select.POLLOUT,
+                    select.POLLIN | select.POLLOUT)
+
     class PollSelector(_BaseSelectorImpl):
         """Poll-based selector."""
 
@@ -340,12 +340,7 @@ def __init__(self):
 
         def register(self, fileobj, events, data=None):
             key = super().register(fileobj, events, data)
-            poll_events = 0
-            if events & EVENT_READ:
-                poll_events |= select.POLLIN
-            if events & EVENT_WRITE:
-                poll_events |= select.POLLOUT
-            self._poll.register(key.fd, poll_events)
+            self._poll.register(key.fd, _POLL_EVENTS[events])
             return key
 
         def unregister(self, fileobj):
@@ -353,6 +348,12 @@ def unregister(self, fileobj):
             self._poll.unregister(key.fd)
             return key
 
+        def _modify_events(self, fileobj, key, events, data):
+            self._poll.modify(key.fd, _POLL_EVENTS[events])
+            key = key._replace(events=events, data=data)
+            self._fd_to_key[key.fd] = key
+            return key
+
         def select(self, timeout=None):
             if timeout is None:
                 timeout = None
@@ -367,6 +368,7 @@ def select(self, timeout=None):
                 fd_event_list = self._poll.poll(timeout)
             except InterruptedError:
                 return ready
+            fd_to_key = self._fd_to_key
             for fd, event in fd_event_list:
                 events = 0
                 if event & ~select.POLLIN:
@@ -374,7 +376,7 @@ def select(self, timeout=None):
                 if event & ~select.POLLOUT:
                     events |= EVENT_READ
 
-                key = self._key_from_fd(fd)
+                key = fd_to_key.get(fd)
                 if key:
                     ready.append((key, events & key.events))
             return ready
@@ -382,6 +384,10 @@ def select(self, timeout=None):
 
 if hasattr(select, 'epoll'):
 
+    # epoll() event masks indexed by a mask of EVENT_READ|EVENT_WRITE
+    _EPOLL_EVENTS = (0, select.EPOLLIN, select.EPOLLOUT,
+                     select.EPOLLIN | select.EPOLLOUT)
+
     class EpollSelector(_BaseSelectorImpl):
         """Epoll-based selector."""
 
@@ -394,12 +400,7 @@ def fileno(self):
 
         def register(self, fileobj, events, data=None):
             key = super().register(fileobj, events, data)
-            epoll_events = 0
-            if events & EVENT_READ:
-                epoll_events |= select.EPOLLIN
-            if events & EVENT_WRITE:
-                epoll_events |= select.EPOLLOUT
-            self._epoll.register(key.fd, epoll_events)
+            self._epoll.register(key.fd, _EPOLL_EVENTS[events])
             return key
 
         def unregister(self, fileobj):
@@ -412,6 +413,17 @@ def unregister(self, fileobj):
                 pass
             return key
 
+        def _modify_events(self, fileobj, key, events, data):
+            try:
+                self._epoll.modify(key.fd, _EPOLL_EVENTS[events])
+            except OSError:
+                # This can happen if the FD was closed since it was
+                # registered, and maybe reused: register it again.
+                return super()._modify_events(fileobj, key, events, data)
+            key = key._replace(events=events, data=data)
+            self._fd_to_key[key.fd] = key
+            return key
+
         def select(self, timeout=None):
             if timeout is None:
                 timeout = -1
@@ -432,6 +444,7 @@ def select(self, timeout=None):
                 fd_event_list = self._epoll.poll(timeout, max_ev)
             except InterruptedError:
                 return ready
+            fd_to_key = self._fd_to_key
             for fd, event in fd_event_list:
                 events = 0
                 if event & ~select.EPOLLIN:
@@ -439,7 +452,7 @@ def select(self, timeout=None):
                 if event & ~select.EPOLLOUT:
                     events |= EVENT_READ
 
-                key = self._key_from_fd(fd)
+                key = fd_to_key.get(fd)
                 if key:
                     ready.append((key, events & key.events))
             return ready
@@ -451,6 +464,10 @@ def close(self):
 
 if hasattr(select, 'devpoll'):
 
+    # /dev/poll event masks indexed by a mask of EVENT_READ|EVENT_WRITE
+    _DEVPOLL_EVENTS = (0, select.POLLIN, select.POLLOUT,
+                       select.POLLIN | select.POLLOUT)
+
     class DevpollSelector(_BaseSelectorImpl):
         """Solaris /dev/poll selector."""
 
@@ -463,12 +480,7 @@ def fileno(self):
 
         def register(self, fileobj, events, data=None):
             key = super().register(fileobj, events, data)
-            poll_events = 0
-            if events & EVENT_READ:
-                poll_events |= select.POLLIN
-            if events & EVENT_WRITE:
-                poll_events |= select.POLLOUT
-            self._devpoll.register(key.fd, poll_events)
+            self._devpoll.register(key.fd, _DEVPOLL_EVENTS[events])
             return key
 
         def unregister(self, fileobj):
@@ -476,6 +488,16 @@ def unregister(self, fileobj):
             self._devpoll.unregister(key.fd)
             return key
 
+        def _modify_events(self, fileobj, key, events, data):
+            try:
+                self._devpoll.modify(key.fd, _DEVPOLL_EVENTS[events])
+            except OSError:
+                # See EpollSelector._modify_events().
+                return super()._modify_events(fileobj, key, events, data)
+            key = key._replace(events=events, data=data)
+            self._fd_to_key[key.fd] = key
+            return key
+
         def select(self, timeout=None):
             if timeout is None:
                 timeout = None
@@ -490,6 +512,7 @@ def select(self, timeout=None):
                 fd_event_list = self._devpoll.poll(timeout)
             except InterruptedError:
                 return ready
+            fd_to_key = self._fd_to_key
             for fd, event in fd_event_list:
                 events = 0
                 if event & ~select.POLLIN:
@@ -497,7 +520,7 @@ def select(self, timeout=None):
                 if event & ~select.POLLOUT:
                     events |= EVENT_READ
 
-                key = self._key_from_fd(fd)
+                key = fd_to_key.get(fd)
                 if key:
                     ready.append((key, events & key.events))
             return ready
@@ -552,14 +575,38 @@ def unregister(self, fileobj):
                     pass
             return key
 
+        def _modify_events(self, fileobj, key, events, data):
+            # Only submit the filters which changed
+            kev_list = []
+            for event, kq_filter in ((EVENT_READ, select.KQ_FILTER_READ),
+                                     (EVENT_WRITE, select.KQ_FILTER_WRITE)):
+                if events & event and not key.events & event:
+                    kev_list.append(select.kevent(key.fd, kq_filter,
+                                                  select.KQ_EV_ADD))
+                elif key.events & event and not events & event:
+                    kev_list.append(select.kevent(key.fd, kq_filter,
+                                                  select.KQ_EV_DELETE))
+            try:
+                self._kqueue.control(kev_list, 0, 0)
+            except OSError:
+                # See EpollSelector._modify_events().
+                return super()._modify_events(fileobj, key, events, data)
+            key = key._replace(events=events, data=data)
+            self._fd_to_key[key.fd] = key
+            return key
+
         def select(self, timeout=None):
             timeout = None if timeout is None else max(timeout, 0)
-            max_ev = len(self._fd_to_key)
+            # kevent() returns immediately without waiting when `nevents`
+            # is zero; make sure that `select()` still honours the timeout
+            # when no FD is registered.
+            max_ev = max(len(self._fd_to_key), 1)
             ready = []
             try:
                 kev_list = self._kqueue.control(None, max_ev, timeout)
             except InterruptedError:
                 return ready
+            fd_to_key = self._fd_to_key
             for kev in kev_list:
                 fd = kev.ident
                 flag = kev.filter
@@ -569,7 +616,7 @@ def select(self, timeout=None):
                 if flag == select.KQ_FILTER_WRITE:
                     events |= EVENT_WRITE
 
-                key = self._key_from_fd(fd)
+                key = fd_to_key.get(fd)
                 if key:
                     ready.append((key, events & key.events))
             return ready
@@ -398,6 +398,20 @@ def feed_data(self, data):
             else:
                 self._paused = True
 
+    def _consume_buffer(self, n):
+        """Remove up to n bytes from the head of the buffer and return them."""
+        if len(self._buffer) <= n:
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            # Copy the data only once: slicing the bytearray would create
+            # a temporary bytearray. The view must be released before the
+            # bytearray is resized.
+            with memoryview(self._buffer) as view:
+                data = bytes(view[:n])
+            del self._buffer[:n]
+        return data
+
     @coroutine
     def _wait_for_data(self, func_name):
         """Wait until feed_data() or feed_eof() is called."""
@@ -420,33 +434,36 @@ def readline(self):
         if self._exception is not None:
             raise self._exception
 
-        line = bytearray()
-        not_enough = True
-
-        while not_enough:
-            while self._buffer and not_enough:
-                ichar = self._buffer.find(b'\n')
-                if ichar < 0:
-                    line.extend(self._buffer)
-                    self._buffer.clear()
-                else:
-                    ichar += 1
-                    line.extend(self._buffer[:ichar])
-                    del self._buffer[:ichar]
-                    not_enough = False
-
-                if len(line) > self._limit:
-                    self._maybe_resume_transport()
-                    raise ValueError('Line is too long')
+        # Search the end of line directly in the buffer, only starting
+        # from the data received since the previous search, and copy the
+        # line once it is complete.
+        start = 0
+        while True:
+            ichar = self._buffer.find(b'\n', start)
+            if ichar >= 0:
+                ichar += 1
+                break
+
+            start = len(self._buffer)
+            if start > self._limit:
+                self._buffer.clear()
+                self._maybe_resume_transport()
+                raise ValueError('Line is too long')
 
             if self._eof:
+                ichar = start
                 break
 
-            if not_enough:
-                yield from self._wait_for_data('readline')
+            yield from self._wait_for_data('readline')
+
+        if ichar > self._limit:
+            del self._buffer[:ichar]
+            self._maybe_resume_transport()
+            raise ValueError('Line is too long')
 
+        line = self._consume_buffer(ichar)
         self._maybe_resume_transport()
-        return bytes(line)
+        return line
 
     @coroutine
     def read(self, n=-1):
@@ -472,14 +489,7 @@ def read(self, n=-1):
             if not self._buffer and not self._eof:
                 yield from self._wait_for_data('read')
 
-        if n < 0 or len(self._buffer) <= n:
-            data = bytes(self._buffer)
-            self._buffer.clear()
-        else:
-            # n > 0 and len(self._buffer) > n
-            data = bytes(self._buffer[:n])
-            del self._buffer[:n]
-
+        data = self._consume_buffer(n)
         self._maybe_resume_transport()
         return data
 
@@ -8,9 +8,9 @@
 
 import concurrent.futures
 import functools
-import inspect
 import linecache
 import traceback
+import types
 import warnings
 import weakref
 
@@ -228,9 +228,11 @@ def _step(self, value=None, exc=None):
                 exc = futures.CancelledError()
             self._must_cancel = False
         coro = self._coro
+        loop = self._loop
+        current_tasks = self.__class__._current_tasks
         self._fut_waiter = None
 
-        self.__class__._current_tasks[self._loop] = self
+        current_tasks[loop] = self
         # Call either coro.throw(exc) or coro.send(value).
         try:
             if exc is not None:
@@ -254,20 +256,20 @@ def _step(self, value=None, exc=None):
                     result.add_done_callback(self._wakeup)
                     self._fut_waiter = result
                     if self._must_cancel:
-                        if self._fut_waiter.cancel():
+                        if result.cancel():
                             self._must_cancel = False
                 else:
-                    self._loop.call_soon(
+                    loop.call_soon(
                         self._step, None,
                         RuntimeError(
                             'yield was used instead of yield from '
                             'in task {!r} with {!r}'.format(self, result)))
             elif result is None:
                 # Bare yield relinquishes control for one event loop iteration.
-                self._loop.call_soon(self._step)
-            elif inspect.isgenerator(result):
+                loop.call_soon(self._step)
+            elif isinstance(result, types.GeneratorType):
                 # Yielding a generator is just wrong.
-                self._loop.call_soon(
+                loop.call_soon(
                     self._step, None,
                     RuntimeError(
                         'yield was used instead of yield from for '
@@ -275,12 +277,12 @@ def _step(self, value=None, exc=None):
                             self, result)))
             else:
                 # Yielding something else is an error.
-                self._loop.call_soon(
+                loop.call_soon(
                     self._step, None,
                     RuntimeError(
                         'Task got bad yield: {!r}'.format(result)))
         finally:
-            self.__class__._current_tasks.pop(self._loop)
+            current_tasks.pop(loop)
             self = None  # Needed to break cycles when an exception occurs.
 
     def _wakeup(self, future):
@@ -358,11 +360,14 @@ def wait_for(fut, timeout, *, loop=None):
     if timeout is None:
         return (yield from fut)
 
+    fut = ensure_future(fut, loop=loop)
+    if fut.done():
+        # No need to arm a timer for a future that already completed.
+        return fut.result()
+
     waiter = futures.Future(loop=loop)
     timeout_handle = loop.call_later(timeout, _release_waiter, waiter)
     cb = functools.partial(_release_waiter, waiter)
-
-    fut = ensure_future(fut, loop=loop)
     fut.add_done_callback(cb)
 
     try:
@@ -391,6 +396,11 @@ def _wait(fs, timeout, return_when, loop):
     The fs argument must be a collection of Futures.
     """
     assert fs, 'Set of Futures is empty.'
+    if all(f.done() for f in fs):
+        # Nothing to wait for: skip the waiter, the timer and the
+        # callbacks.
+        return set(fs), set()
+
     waiter = futures.Future(loop=loop)
     timeout_handle = None
     if timeout is not None:
@@ -420,10 +430,11 @@ def _on_completion(f):
 
     done, pending = set(), set()
     for f in fs:
-        f.remove_done_callback(_on_completion)
         if f.done():
+            # A done future already dropped its callbacks.
             done.add(f)
         else:
+            f.remove_done_callback(_on_completion)
             pending.add(f)
     return done, pending
 
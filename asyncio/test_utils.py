@@ -104,21 +104,31 @@ def handle_error(self, request, client_address):
 
 class SSLWSGIServerMixin:
 
+    # Server-side SSL context shared by all test servers, created on
+    # first use so that the key and certificate are only loaded once.
+    _ssl_context = None
+
+    def _get_ssl_context(self):
+        context = SSLWSGIServerMixin._ssl_context
+        if context is None:
+            # The relative location of our test directory (which
+            # contains the ssl key and certificate files) differs
+            # between the stdlib and stand-alone asyncio.
+            # Prefer our own if we can find it.
+            here = os.path.join(os.path.dirname(__file__), '..', 'tests')
+            if not os.path.isdir(here):
+                here = os.path.join(os.path.dirname(os.__file__),
+                                    'test', 'test_asyncio')
+            keyfile = os.path.join(here, 'ssl_key.pem')
+            certfile = os.path.join(here, 'ssl_cert.pem')
+            context = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
+            context.load_cert_chain(certfile, keyfile)
+            SSLWSGIServerMixin._ssl_context = context
+        return context
+
     def finish_request(self, request, client_address):
-        # The relative location of our test directory (which
-        # contains the ssl key and certificate files) differs
-        # between the stdlib and stand-alone asyncio.
-        # Prefer our own if we can find it.
-        here = os.path.join(os.path.dirname(__file__), '..', 'tests')
-        if not os.path.isdir(here):
-            here = os.path.join(os.path.dirname(os.__file__),
-                                'test', 'test_asyncio')
-        keyfile = os.path.join(here, 'ssl_key.pem')
-        certfile = os.path.join(here, 'ssl_cert.pem')
-        ssock = ssl.wrap_socket(request,
-                                keyfile=keyfile,
-                                certfile=certfile,
-                                server_side=True)
+        context = self._get_ssl_context()
+        ssock = context.wrap_socket(request, server_side=True)
         try:
             self.RequestHandlerClass(ssock, client_address, self)
             ssock.close()
@@ -1,6 +1,8 @@
 """Selector event loop for Unix with signal handling."""
 
+import collections
 import errno
+import itertools
 import os
 import signal
 import socket
@@ -406,6 +408,15 @@ def _call_connection_lost(self, exc):
             self._loop = None
 
 
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = -1
+if _IOV_MAX <= 0:
+    # Minimum value required by POSIX
+    _IOV_MAX = 16
+
+
 class _UnixWritePipeTransport(transports._FlowControlMixin,
                               transports.WriteTransport):
 
@@ -423,7 +434,8 @@ def __init__(self, loop, pipe, protocol, waiter=None, extra=None):
                              "pipes, sockets and character devices")
         _set_nonblocking(self._fileno)
         self._protocol = protocol
-        self._buffer = []
+        self._buffer = collections.deque()
+        self._buffer_size = 0
         self._conn_lost = 0
         self._closing = False  # Set when close() or write_eof() called.
 
@@ -464,7 +476,7 @@ def __repr__(self):
         return '<%s>' % ' '.join(info)
 
     def get_write_buffer_size(self):
-        return sum(len(data) for data in self._buffer)
+        return self._buffer_size
 
     def _read_ready(self):
         # Pipe was closed by peer.
@@ -479,6 +491,10 @@ def write(self, data):
         assert isinstance(data, (bytes, bytearray, memoryview)), repr(data)
         if isinstance(data, bytearray):
             data = memoryview(data)
+        elif isinstance(data, memoryview) and data.itemsize != 1:
+            # Buffer sizes and os.writev() results are in bytes: view the
+            # data as bytes so that len() and slicing count bytes too.
+            data = data.cast('B')
         if not data:
             return
 
@@ -506,35 +522,43 @@ def write(self, data):
             self._loop.add_writer(self._fileno, self._write_ready)
 
         self._buffer.append(data)
+        self._buffer_size += len(data)
         self._maybe_pause_protocol()
 
     def _write_ready(self):
-        data = b''.join(self._buffer)
-        assert data, 'Data should not be empty'
+        assert self._buffer, 'Data should not be empty'
 
-        self._buffer.clear()
+        # Gather-write the pending buffers instead of concatenating them
+        # into a temporary bytes object.
+        buffers = list(itertools.islice(self._buffer, _IOV_MAX))
         try:
-            n = os.write(self._fileno, data)
+            n = os.writev(self._fileno, buffers)
         except (BlockingIOError, InterruptedError):
-            self._buffer.append(data)
+            pass
         except Exception as exc:
             self._conn_lost += 1
-            # Remove writer here, _fatal_error() doesn't it
-            # because _buffer is empty.
-            self._loop.remove_writer(self._fileno)
             self._fatal_error(exc, 'Fatal write error on pipe transport')
         else:
-            if n == len(data):
-                self._loop.remove_writer(self._fileno)
+            self._buffer_size -= n
+            # Drop the buffers which were written completely
+            while n:
+                data = self._buffer[0]
+                if n < len(data):
+                    self._buffer[0] = data[n:]
+                    break
+                self._buffer.popleft()
+                n -= len(data)
+
+            if not self._buffer:
+                # Resume the protocol before unregistering the writer: if
+                # resume_writing() appends to the buffer, the writer stays
+                # registered instead of being removed and added again.
                 self._maybe_resume_protocol()  # May append to buffer.
-                if not self._buffer and self._closing:
-                    self._loop.remove_reader(self._fileno)
-                    self._call_connection_lost(None)
-                return
-            elif n > 0:
-                data = data[n:]
-
-            self._buffer.append(data)  # Try again later.
+                if not self._buffer:
+                    self._loop.remove_writer(self._fileno)
+                    if self._closing:
+                        self._loop.remove_reader(self._fileno)
+                        self._call_connection_lost(None)
 
     def can_write_eof(self):
         return True
@@ -584,6 +608,7 @@ def _close(self, exc=None):
         if self._buffer:
             self._loop.remove_writer(self._fileno)
         self._buffer.clear()
+        self._buffer_size = 0
         self._loop.remove_reader(self._fileno)
         self._loop.call_soon(self._call_connection_lost, exc)
 
@@ -121,9 +121,33 @@ def cb():
 
         h = self.loop.call_later(10.0, cb)
         self.assertIsInstance(h, asyncio.TimerHandle)
-        self.assertIn(h, self.loop._scheduled)
+        self.assertIn(h, [entry[2] for entry in self.loop._scheduled])
         self.assertNotIn(h, self.loop._ready)
 
+    def test_call_at_same_deadline(self):
+        class Uncomparable:
+            def __eq__(self, other):
+                raise ValueError('cannot compare')
+
+            __hash__ = object.__hash__
+
+        calls = []
+
+        def cb(arg):
+            calls.append(arg)
+
+        when = self.loop.time() - 1
+        args = [Uncomparable() for i in range(3)]
+        for arg in args:
+            # Timers sharing a deadline must not compare their arguments
+            self.loop.call_at(when, cb, arg)
+
+        self.loop._process_events = mock.Mock()
+        self.loop._run_once()
+        # Timers with the same deadline run in scheduling order
+        self.assertEqual([id(arg) for arg in calls],
+                         [id(arg) for arg in args])
+
     def test_call_later_negative_delays(self):
         calls = []
 
@@ -273,13 +297,13 @@ def test__run_once(self):
         h1.cancel()
 
         self.loop._process_events = mock.Mock()
-        self.loop._scheduled.append(h1)
-        self.loop._scheduled.append(h2)
+        self.loop._scheduled.append((h1._when, 0, h1))
+        self.loop._scheduled.append((h2._when, 1, h2))
         self.loop._run_once()
 
         t = self.loop._selector.select.call_args[0][0]
         self.assertTrue(9.5 < t < 10.5, t)
-        self.assertEqual([h2], self.loop._scheduled)
+        self.assertEqual([(h2._when, 1, h2)], self.loop._scheduled)
         self.assertTrue(self.loop._process_events.called)
 
     def test_set_debug(self):
@@ -326,7 +350,7 @@ def cb(loop):
                                 self.loop)
 
         self.loop._process_events = mock.Mock()
-        self.loop._scheduled.append(h)
+        self.loop._scheduled.append((h._when, 0, h))
         self.loop._run_once()
 
         self.assertTrue(processed)
@@ -406,7 +430,8 @@ def cb():
         self.assertEqual(len(self.loop._scheduled), not_cancelled_count)
 
         # Ensure only uncancelled events remain scheduled
-        self.assertTrue(all([not x._cancelled for x in self.loop._scheduled]))
+        self.assertTrue(all([not h._cancelled
+                             for when, seq, h in self.loop._scheduled]))
 
     def test_run_until_complete_type_error(self):
         self.assertRaises(TypeError,
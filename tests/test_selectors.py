@@ -109,6 +109,27 @@ def test_unregister_after_fd_close_and_reuse(self):
         s.unregister(r)
         s.unregister(w)
 
+    def test_modify_after_fd_close_and_reuse(self):
+        s = self.SELECTOR()
+        self.addCleanup(s.close)
+        rd, wr = self.make_socketpair()
+        r, w = rd.fileno(), wr.fileno()
+        s.register(r, selectors.EVENT_READ)
+        s.register(w, selectors.EVENT_WRITE)
+        rd2, wr2 = self.make_socketpair()
+        rd.close()
+        wr.close()
+        os.dup2(rd2.fileno(), r)
+        os.dup2(wr2.fileno(), w)
+        self.addCleanup(os.close, r)
+        self.addCleanup(os.close, w)
+        key = s.modify(r, selectors.EVENT_WRITE)
+        self.assertEqual(key.events, selectors.EVENT_WRITE)
+        self.assertEqual(s.get_key(r), key)
+        key = s.modify(w, selectors.EVENT_READ)
+        self.assertEqual(key.events, selectors.EVENT_READ)
+        self.assertEqual(s.get_key(w), key)
+
     def test_unregister_after_socket_close(self):
         s = self.SELECTOR()
         self.addCleanup(s.close)
@@ -158,6 +179,29 @@ def test_modify(self):
         self.assertFalse(s.register.called)
         self.assertFalse(s.unregister.called)
 
+    def test_modify_events(self):
+        s = self.SELECTOR()
+        self.addCleanup(s.close)
+
+        rd, wr = self.make_socketpair()
+
+        s.register(rd, selectors.EVENT_READ, "data")
+
+        # the socket is writable but not readable
+        key = s.modify(rd, selectors.EVENT_READ | selectors.EVENT_WRITE)
+        self.assertEqual(key, s.get_key(rd))
+        self.assertEqual([(key, selectors.EVENT_WRITE)], s.select(0))
+
+        wr.send(b'x')
+        key = s.modify(rd, selectors.EVENT_READ, "data2")
+        self.assertEqual(key.events, selectors.EVENT_READ)
+        self.assertEqual(key.data, "data2")
+        self.assertEqual([(key, selectors.EVENT_READ)], s.select(1))
+
+        # modify with invalid events keeps the file object registered
+        self.assertRaises(ValueError, s.modify, rd, 999999)
+        self.assertEqual(key, s.get_key(rd))
+
     def test_close(self):
         s = self.SELECTOR()
         self.addCleanup(s.close)
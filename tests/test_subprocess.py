@@ -74,6 +74,79 @@ def test_proc_exited(self):
 
         transport.close()
 
+    def test_pipe_data_received(self):
+        waiter = asyncio.Future(loop=self.loop)
+        transport, protocol = self.create_transport(waiter)
+        protocol.pipe_data_received._is_coroutine = False
+
+        # data received before the pipes are connected is delayed
+        transport._pipe_data_received(1, b'early')
+        self.assertFalse(protocol.pipe_data_received.called)
+        self.loop.run_until_complete(waiter)
+        test_utils.run_briefly(self.loop)
+        protocol.pipe_data_received.assert_called_with(1, b'early')
+
+        # then data is passed to the protocol without waiting for the loop
+        transport._pipe_data_received(1, b'data')
+        protocol.pipe_data_received.assert_called_with(1, b'data')
+
+        transport.close()
+
+    def test_pipe_data_received_order(self):
+        waiter = asyncio.Future(loop=self.loop)
+        transport, protocol = self.create_transport(waiter)
+        events = []
+        protocol.connection_made.side_effect = (
+            lambda transport: events.append('connection_made'))
+        protocol.pipe_data_received._is_coroutine = False
+        protocol.pipe_data_received.side_effect = (
+            lambda fd, data: events.append(data))
+
+        transport._pipe_data_received(1, b'early')
+        # A pipe read callback running in the same loop iteration as
+        # _connect_pipes() must not overtake connection_made() and the
+        # data queued before it
+        self.loop.call_soon(transport._pipe_data_received, 1, b'late')
+        self.loop.run_until_complete(waiter)
+        test_utils.run_briefly(self.loop)
+
+        self.assertEqual(events, ['connection_made', b'early', b'late'])
+
+        transport.close()
+
+    def test_pending_calls_callback_error(self):
+        waiter = asyncio.Future(loop=self.loop)
+        transport, protocol = self.create_transport(waiter)
+        events = []
+        protocol.connection_made.side_effect = (
+            lambda transport: events.append('connection_made'))
+
+        def pipe_data_received(fd, data):
+            events.append(data)
+            raise ValueError(data)
+        protocol.pipe_data_received._is_coroutine = False
+        protocol.pipe_data_received.side_effect = pipe_data_received
+        protocol.process_exited.side_effect = (
+            lambda: events.append('process_exited'))
+        protocol.connection_lost.side_effect = (
+            lambda exc: events.append('connection_lost'))
+        self.loop.call_exception_handler = mock.Mock()
+
+        # Events queued before the pipes are connected
+        transport._pipe_data_received(1, b'data')
+        transport._process_exited(0)
+        self.loop.run_until_complete(waiter)
+        test_utils.run_briefly(self.loop)
+
+        # The error is reported and the following events still run
+        self.assertEqual(events, ['connection_made', b'data',
+                                  'process_exited', 'connection_lost'])
+        self.assertEqual(self.loop.call_exception_handler.call_count, 1)
+        context = self.loop.call_exception_handler.call_args[0][0]
+        self.assertIsInstance(context['exception'], ValueError)
+
+        transport.close()
+
 
 class SubprocessMixin:
 
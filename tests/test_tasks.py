@@ -613,6 +613,19 @@ def coro():
                                                        loop=loop))
         self.assertEqual(res, 'done')
 
+    def test_wait_for_done_future(self):
+        loop = self.new_test_loop()
+
+        fut = asyncio.Future(loop=loop)
+        fut.set_result('done')
+        loop.call_later = mock.Mock()
+
+        res = loop.run_until_complete(asyncio.wait_for(fut, timeout=0.1,
+                                                       loop=loop))
+        self.assertEqual(res, 'done')
+        # No timer was armed for an already completed future
+        self.assertFalse(loop.call_later.called)
+
     def test_wait_for_with_global_loop(self):
 
         def gen():
@@ -798,6 +811,20 @@ def coro2():
         self.assertTrue(b.done())
         self.assertIsNone(b.result())
 
+    def test_wait_all_done(self):
+        a = asyncio.Future(loop=self.loop)
+        a.set_result(1)
+        b = asyncio.Future(loop=self.loop)
+        b.set_exception(ValueError())
+
+        done, pending = self.loop.run_until_complete(
+            asyncio.wait([a, b], timeout=10, loop=self.loop))
+        self.assertEqual({a, b}, done)
+        self.assertEqual(set(), pending)
+        self.assertIsInstance(b.exception(), ValueError)
+        # No timeout timer was armed
+        self.assertFalse(self.loop._scheduled)
+
     def test_wait_first_exception(self):
 
         def gen():
@@ -1330,6 +1357,19 @@ def fn2():
             yield
         self.assertTrue(asyncio.iscoroutinefunction(fn2))
 
+    def test_iscoroutine_typecache(self):
+        def gen():
+            yield
+
+        self.assertFalse(asyncio.iscoroutine(object()))
+        self.assertNotIn(object, coroutines._iscoroutine_typecache)
+
+        coro = gen()
+        self.assertTrue(asyncio.iscoroutine(coro))
+        self.assertIn(types.GeneratorType, coroutines._iscoroutine_typecache)
+        # Served from the cache the second time
+        self.assertTrue(asyncio.iscoroutine(coro))
+
     def test_yield_vs_yield_from(self):
         fut = asyncio.Future(loop=self.loop)
 
@@ -1,5 +1,6 @@
 """Tests for unix_events.py."""
 
+import array
 import collections
 import errno
 import io
@@ -518,7 +519,7 @@ def test_write(self, m_write):
         tr.write(b'data')
         m_write.assert_called_with(5, b'data')
         self.assertFalse(self.loop.writers)
-        self.assertEqual([], tr._buffer)
+        self.assertEqual([], list(tr._buffer))
 
     @mock.patch('os.write')
     def test_write_no_data(self, m_write):
@@ -526,7 +527,7 @@ def test_write_no_data(self, m_write):
         tr.write(b'')
         self.assertFalse(m_write.called)
         self.assertFalse(self.loop.writers)
-        self.assertEqual([], tr._buffer)
+        self.assertEqual([], list(tr._buffer))
 
     @mock.patch('os.write')
     def test_write_partial(self, m_write):
@@ -535,17 +536,43 @@ def test_write_partial(self, m_write):
         tr.write(b'data')
         m_write.assert_called_with(5, b'data')
         self.loop.assert_writer(5, tr._write_ready)
-        self.assertEqual([b'ta'], tr._buffer)
+        self.assertEqual([b'ta'], list(tr._buffer))
+        self.assertEqual(2, tr.get_write_buffer_size())
+
+    @mock.patch('os.writev')
+    @mock.patch('os.write')
+    def test_write_memoryview_multibyte(self, m_write, m_writev):
+        tr = self.write_pipe_transport()
+        data = memoryview(array.array('I', [1, 2, 3, 4]))
+        m_write.return_value = 0
+        tr.write(data)
+        self.loop.assert_writer(5, tr._write_ready)
+        # The buffer size is counted in bytes, not in items
+        self.assertEqual(data.nbytes, tr.get_write_buffer_size())
+
+        m_writev.return_value = 6
+        tr._write_ready()
+        self.assertEqual(data.nbytes - 6, tr.get_write_buffer_size())
+        self.assertEqual([data.tobytes()[6:]],
+                         [bytes(buf) for buf in tr._buffer])
+
+        m_writev.return_value = data.nbytes - 6
+        tr._write_ready()
+        self.assertFalse(self.loop.writers)
+        self.assertFalse(tr._buffer)
+        self.assertEqual(0, tr.get_write_buffer_size())
 
     @mock.patch('os.write')
     def test_write_buffer(self, m_write):
         tr = self.write_pipe_transport()
         self.loop.add_writer(5, tr._write_ready)
-        tr._buffer = [b'previous']
+        tr._buffer = collections.deque([b'previous'])
+        tr._buffer_size = 8
         tr.write(b'data')
         self.assertFalse(m_write.called)
         self.loop.assert_writer(5, tr._write_ready)
-        self.assertEqual([b'previous', b'data'], tr._buffer)
+        self.assertEqual([b'previous', b'data'], list(tr._buffer))
+        self.assertEqual(12, tr.get_write_buffer_size())
 
     @mock.patch('os.write')
     def test_write_again(self, m_write):
@@ -554,7 +581,7 @@ def test_write_again(self, m_write):
         tr.write(b'data')
         m_write.assert_called_with(5, b'data')
         self.loop.assert_writer(5, tr._write_ready)
-        self.assertEqual([b'data'], tr._buffer)
+        self.assertEqual([b'data'], list(tr._buffer))
 
     @mock.patch('asyncio.unix_events.logger')
     @mock.patch('os.write')
@@ -566,7 +593,7 @@ def test_write_err(self, m_write, m_log):
         tr.write(b'data')
         m_write.assert_called_with(5, b'data')
         self.assertFalse(self.loop.writers)
-        self.assertEqual([], tr._buffer)
+        self.assertEqual([], list(tr._buffer))
         tr._fatal_error.assert_called_with(
                             err,
                             'Fatal write error on pipe transport')
@@ -602,62 +629,100 @@ def test__read_ready(self):
         test_utils.run_briefly(self.loop)
         self.protocol.connection_lost.assert_called_with(None)
 
-    @mock.patch('os.write')
-    def test__write_ready(self, m_write):
+    @mock.patch('os.writev')
+    def test__write_ready(self, m_writev):
         tr = self.write_pipe_transport()
         self.loop.add_writer(5, tr._write_ready)
-        tr._buffer = [b'da', b'ta']
-        m_write.return_value = 4
+        tr._buffer = collections.deque([b'da', b'ta'])
+        tr._buffer_size = 4
+        m_writev.return_value = 4
         tr._write_ready()
-        m_write.assert_called_with(5, b'data')
+        m_writev.assert_called_with(5, [b'da', b'ta'])
         self.assertFalse(self.loop.writers)
-        self.assertEqual([], tr._buffer)
+        self.assertEqual([], list(tr._buffer))
 
+    @mock.patch('os.writev')
     @mock.patch('os.write')
-    def test__write_ready_partial(self, m_write):
+    def test__write_ready_resume_writing(self, m_write, m_writev):
         tr = self.write_pipe_transport()
         self.loop.add_writer(5, tr._write_ready)
-        tr._buffer = [b'da', b'ta']
-        m_write.return_value = 3
+        tr._buffer = collections.deque([b'da', b'ta'])
+        tr._buffer_size = 4
+        tr._protocol_paused = True
+        self.protocol.resume_writing.side_effect = lambda: tr.write(b'more')
+        m_writev.return_value = 4
+        m_write.side_effect = BlockingIOError()
         tr._write_ready()
-        m_write.assert_called_with(5, b'data')
+        m_write.assert_called_with(5, b'more')
+        # resume_writing() refilled the buffer: the writer must not
+        # have been removed
+        self.assertEqual(0, self.loop.remove_writer_count[5])
         self.loop.assert_writer(5, tr._write_ready)
-        self.assertEqual([b'a'], tr._buffer)
+        self.assertEqual([b'more'], list(tr._buffer))
 
-    @mock.patch('os.write')
-    def test__write_ready_again(self, m_write):
+    @mock.patch('os.writev')
+    def test__write_ready_partial(self, m_writev):
         tr = self.write_pipe_transport()
         self.loop.add_writer(5, tr._write_ready)
-        tr._buffer = [b'da', b'ta']
-        m_write.side_effect = BlockingIOError()
+        tr._buffer = collections.deque([b'da', b'ta'])
+        tr._buffer_size = 4
+        m_writev.return_value = 3
         tr._write_ready()
-        m_write.assert_called_with(5, b'data')
+        m_writev.assert_called_with(5, [b'da', b'ta'])
         self.loop.assert_writer(5, tr._write_ready)
-        self.assertEqual([b'data'], tr._buffer)
+        self.assertEqual([b'a'], list(tr._buffer))
+        self.assertEqual(1, tr.get_write_buffer_size())
 
-    @mock.patch('os.write')
-    def test__write_ready_empty(self, m_write):
+    @mock.patch('asyncio.unix_events._IOV_MAX', 1)
+    @mock.patch('os.writev')
+    def test__write_ready_iov_max(self, m_writev):
         tr = self.write_pipe_transport()
         self.loop.add_writer(5, tr._write_ready)
-        tr._buffer = [b'da', b'ta']
-        m_write.return_value = 0
+        tr._buffer = collections.deque([b'da', b'ta'])
+        tr._buffer_size = 4
+        m_writev.return_value = 2
         tr._write_ready()
-        m_write.assert_called_with(5, b'data')
+        m_writev.assert_called_with(5, [b'da'])
+        self.loop.assert_writer(5, tr._write_ready)
+        self.assertEqual([b'ta'], list(tr._buffer))
+
+    @mock.patch('os.writev')
+    def test__write_ready_again(self, m_writev):
+        tr = self.write_pipe_transport()
+        self.loop.add_writer(5, tr._write_ready)
+        tr._buffer = collections.deque([b'da', b'ta'])
+        tr._buffer_size = 4
+        m_writev.side_effect = BlockingIOError()
+        tr._write_ready()
+        m_writev.assert_called_with(5, [b'da', b'ta'])
+        self.loop.assert_writer(5, tr._write_ready)
+        self.assertEqual([b'da', b'ta'], list(tr._buffer))
+
+    @mock.patch('os.writev')
+    def test__write_ready_empty(self, m_writev):
+        tr = self.write_pipe_transport()
+        self.loop.add_writer(5, tr._write_ready)
+        tr._buffer = collections.deque([b'da', b'ta'])
+        tr._buffer_size = 4
+        m_writev.return_value = 0
+        tr._write_ready()
+        m_writev.assert_called_with(5, [b'da', b'ta'])
         self.loop.assert_writer(5, tr._write_ready)
-        self.assertEqual([b'data'], tr._buffer)
+        self.assertEqual([b'da', b'ta'], list(tr._buffer))
 
     @mock.patch('asyncio.log.logger.error')
-    @mock.patch('os.write')
-    def test__write_ready_err(self, m_write, m_logexc):
+    @mock.patch('os.writev')
+    def test__write_ready_err(self, m_writev, m_logexc):
         tr = self.write_pipe_transport()
         self.loop.add_writer(5, tr._write_ready)
-        tr._buffer = [b'da', b'ta']
-        m_write.side_effect = err = OSError()
+        tr._buffer = collections.deque([b'da', b'ta'])
+        tr._buffer_size = 4
+        m_writev.side_effect = err = OSError()
         tr._write_ready()
-        m_write.assert_called_with(5, b'data')
+        m_writev.assert_called_with(5, [b'da', b'ta'])
         self.assertFalse(self.loop.writers)
         self.assertFalse(self.loop.readers)
-        self.assertEqual([], tr._buffer)
+        self.assertEqual([], list(tr._buffer))
         self.assertTrue(tr._closing)
         m_logexc.assert_called_with(
             test_utils.MockPattern(
@@ -668,18 +733,19 @@ def test__write_ready_err(self, m_write, m_logexc):
         test_utils.run_briefly(self.loop)
         self.protocol.connection_lost.assert_called_with(err)
 
-    @mock.patch('os.write')
-    def test__write_ready_closing(self, m_write):
+    @mock.patch('os.writev')
+    def test__write_ready_closing(self, m_writev):
         tr = self.write_pipe_transport()
         self.loop.add_writer(5, tr._write_ready)
         tr._closing = True
-        tr._buffer = [b'da', b'ta']
-        m_write.return_value = 4
+        tr._buffer = collections.deque([b'da', b'ta'])
+        tr._buffer_size = 4
+        m_writev.return_value = 4
         tr._write_ready()
-        m_write.assert_called_with(5, b'data')
+        m_writev.assert_called_with(5, [b'da', b'ta'])
         self.assertFalse(self.loop.writers)
         self.assertFalse(self.loop.readers)
-        self.assertEqual([], tr._buffer)
+        self.assertEqual([], list(tr._buffer))
         self.protocol.connection_lost.assert_called_with(None)
         self.pipe.close.assert_called_with()
 
@@ -688,12 +754,13 @@ def test_abort(self, m_write):
         tr = self.write_pipe_transport()
         self.loop.add_writer(5, tr._write_ready)
         self.loop.add_reader(5, tr._read_ready)
-        tr._buffer = [b'da', b'ta']
+        tr._buffer = collections.deque([b'da', b'ta'])
+        tr._buffer_size = 4
         tr.abort()
         self.assertFalse(m_write.called)
         self.assertFalse(self.loop.readers)
         self.assertFalse(self.loop.writers)
-        self.assertEqual([], tr._buffer)
+        self.assertEqual([], list(tr._buffer))
         self.assertTrue(tr._closing)
         test_utils.run_briefly(self.loop)
         self.protocol.connection_lost.assert_called_with(None)
@@ -750,7 +817,8 @@ def test_write_eof(self):
 
     def test_write_eof_pending(self):
         tr = self.write_pipe_transport()
-        tr._buffer = [b'data']
+        tr._buffer = collections.deque([b'data'])
+        tr._buffer_size = 4
         tr.write_eof()
         self.assertTrue(tr._closing)
         self.assertFalse(self.protocol.connection_lost.called)